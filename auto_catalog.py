@@ -12,188 +12,387 @@ Scans a directory of PDF files and produces an Excel catalog with columns:
 - Format (optional)  (always "PDF")
 
 Dependencies (all open-source):
-  pip install pymupdf pandas openpyxl
+  pip install pymupdf pandas numpy openpyxl
 
 Optional (for scanned PDFs OCR):
   pip install pytesseract pdf2image
+  pip install tesserocr   (faster: reuses one Tesseract instance per worker)
   + install system: Tesseract & Poppler
 
 Run:
   python auto_catalog.py -i ./pdf -o catalog.xlsx
   python auto_catalog.py -i ./pdf -o catalog.xlsx --ocr
+  python auto_catalog.py -i ./pdf -o catalog.xlsx --no-cache
 """
 
 from __future__ import annotations
-import argparse, re
+import argparse, json, os, queue, re, threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 import fitz    # PyMuPDF
+import numpy as np
 import pandas as pd
+from openpyxl import Workbook
 
-# Optional OCR 
-try:
-    import pytesseract
-    from pdf2image import convert_from_path
-    OCR_AVAILABLE = True
-except Exception:
-    OCR_AVAILABLE = False
+# Optional OCR, imported on first use so runs without --ocr never load PIL/poppler glue
+# (tesserocr keeps one in-process Tesseract per worker; pytesseract spawns a tesseract
+# subprocess per page and is the fallback)
+convert_from_path = tesserocr = pytesseract = None
+_OCR_OK = None    # None until _ocr_available() has probed the imports
+_TESS_API = None  # per-process tesserocr.PyTessBaseAPI, created on first use
 
 UNKNOWN = "Unknown"
+COLUMNS = ("Book Title","Author","Editor","Year of Publishing","Publisher","Language","Number of Pages","Format","Source File")
+RECORD_FIELDS = COLUMNS[:-1]  # what parse_pdf returns; build_catalog adds Source File
+Record = Tuple[str, ...]
+
+# Pre-compiled patterns (parse_pdf runs these for every file; the per-line
+# publisher scan alone would churn re's internal cache on large batches)
+_RE_CLEAN_TRAIL = re.compile(r"[,;]\s*$")
+_RE_TITLES = re.compile(r"\b(Dr\.?|Prof\.?|Professor|Ph\.?D\.?|M\.?D\.?)\b\.?", re.I)
+_RE_WS = re.compile(r"\s{2,}")
+_RE_AUTHOR = re.compile(r"\b(?:By|Written by|Author(?:s)?:)\s*([^\n,]+)", re.I)
+_RE_EDITOR = re.compile(r"\b(?:Edited by|Editor(?:s)?:)\s*([^\n,]+)", re.I)
+_RE_UNKNOWN = re.compile(r"unknown", re.I)
+_RE_YEAR = re.compile(r"(?<!\d)(1[5-9]\d{2}|20[0-2]\d|203[0-5])(?!\d)")
+# year-context patterns in priority order; each captures the first year after its term
+_RE_YEAR_CTX = tuple(
+    re.compile(re.escape(term) + r".{0,60}?" + _RE_YEAR.pattern, re.I | re.S)
+    for term in ("©", "Copyright", "First published", "Published", "Reprinted")
+)
+_RE_PUB = re.compile(r"\b(Published by|Publisher|Imprint|Printed by)\s*[:\-]\s*(.+)", re.I)
+_RE_PUB_SPLIT = re.compile(r"[;|•]|Tel:|Phone:|Fax:|Email:|www\.")
+_RE_PUB_FALLBACK = re.compile(r"\b(Press|Publications|Publishers|University|House|Books)\b", re.I)
+_RE_TITLE_SKIP = re.compile(r"\b(by|edited|editor|copyright|published|publisher|isbn|issn)\b", re.I)
+_RE_TITLE_OK = re.compile(r"^[\w :;,'&\-\(\)\.\!\?]+$")
 
 def _clean_name(s: str) -> str:
-    s = re.sub(r"[,;]\s*$", "", (s or "").strip())
-    s = re.sub(r"\b(Dr\.?|Prof\.?|Professor|Ph\.?D\.?|M\.?D\.?)\b\.?", "", s, flags=re.I)
-    return re.sub(r"\s{2,}", " ", s).strip() or UNKNOWN
+    s = _RE_CLEAN_TRAIL.sub("", (s or "").strip())
+    s = _RE_TITLES.sub("", s)
+    return _RE_WS.sub(" ", s).strip() or UNKNOWN
+
+# default "text" flags plus dehyphenation, so words split across line wraps still match
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT | fitz.TEXT_DEHYPHENATE
 
-def _front_text(doc: fitz.Document, pages: int = 8) -> str:
+def _front_text_pages(doc: fitz.Document, start: int, stop: int) -> List[str]:
     out = []
-    for i in range(min(pages, len(doc))):
+    try:  # a broken page ends the scan; keep whatever was read before it
+        for page in doc.pages(start, min(stop, len(doc))):
+            out.append(page.get_text("text", flags=_TEXT_FLAGS))
+    except Exception:
+        pass
+    return out
+
+def _ocr_available() -> bool:
+    global _OCR_OK, convert_from_path, tesserocr, pytesseract
+    if _OCR_OK is None:
+        _limit_omp_threads()  # before tesserocr loads libgomp (main() probes in the parent)
         try:
-            out.append(doc.load_page(i).get_text("text"))
+            from pdf2image import convert_from_path
+            try:
+                import tesserocr
+            except Exception:
+                import pytesseract
+            _OCR_OK = True
         except Exception:
-            pass
-    return "\n".join(out).strip()
+            _OCR_OK = False
+    return _OCR_OK
+
+def _limit_omp_threads() -> None:
+    # pool workers already run in parallel; keep Tesseract's OpenMP to one thread each.
+    # libgomp reads this once at load, so it must be set in the parent before any
+    # tesserocr import or worker start; workers and tesseract subprocesses inherit it
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+def _tess_api():
+    # None when tesserocr is missing or can't initialise (e.g. no tessdata); the
+    # failure is remembered and pytesseract takes over for the rest of the process
+    global _TESS_API, _OCR_OK, tesserocr, pytesseract
+    if _TESS_API is None and tesserocr is not None:
+        try:
+            _TESS_API = tesserocr.PyTessBaseAPI()
+        except Exception:
+            tesserocr = None
+            try:
+                import pytesseract
+            except Exception:
+                _OCR_OK = False
+    return _TESS_API
 
 def _ocr_first_pages(pdf: Path, pages: int = 3) -> str:
-    if not OCR_AVAILABLE:
+    if not _ocr_available():
         return ""
     try:
+        api = _tess_api()
+        if api is None and pytesseract is None:
+            return ""
         txt = []
-        for img in convert_from_path(str(pdf), first_page=1, last_page=pages):
-            txt.append(pytesseract.image_to_string(img))
+        # grayscale JPEG is all Tesseract needs; poppler renders the pages in parallel
+        imgs = convert_from_path(str(pdf), first_page=1, last_page=pages, dpi=200,
+                                 thread_count=min(4, os.cpu_count() or 1), fmt="jpeg", grayscale=True)
+        for img in imgs:
+            if api is not None:
+                api.SetImage(img)
+                txt.append(api.GetUTF8Text())
+            else:
+                txt.append(pytesseract.image_to_string(img))
         return "\n".join(txt)
     except Exception:
         return ""
 
 def _guess_title(lines: List[str]) -> str:
-    cand = []
-    for ln in lines[:25]:
-        t = ln.strip()
-        if not t or len(t) < 4: continue
-        if re.search(r"\b(by|edited|editor|copyright|published|publisher|isbn|issn)\b", t, re.I): continue
+    best = None  # ((-score, len), text); smaller key wins
+    for t in lines[:25]:  # lines arrive stripped and non-empty
+        if len(t) < 4: continue
+        if _RE_TITLE_SKIP.search(t): continue
         score = (2 if t.istitle() else 0) + (1 if (t.isupper() and len(t) <= 80) else 0)
         score += (1 if 10 <= len(t) <= 120 else 0)
-        score += (1 if re.match(r"^[\w :;,'&\-\(\)\.\!\?]+$", t) else 0)
+        score += (1 if _RE_TITLE_OK.match(t) else 0)
         if len(t) > 140: score -= 1
-        if score >= 2: cand.append((score, t))
-    return (sorted(cand, key=lambda x: (-x[0], len(x[1])))[0][1] if cand else UNKNOWN)
+        if score < 2: continue
+        key = (-score, len(t))
+        if best is None or key < best[0]: best = (key, t)
+        if score >= 4: break  # top practical score; the first such line is the title
+    return best[1] if best else UNKNOWN
 
 def _find_people(text: str, meta_author: str | None) -> tuple[str, str]:
     author = editor = UNKNOWN
     # author
-    m = re.search(r"\b(?:By|Written by|Author(?:s)?:)\s*([^\n,]+)", text, flags=re.I)
+    m = _RE_AUTHOR.search(text)
     if m: author = _clean_name(m.group(1))
-    elif meta_author and not re.search(r"unknown", meta_author or "", re.I):
+    elif meta_author and not _RE_UNKNOWN.search(meta_author or ""):
         author = _clean_name(meta_author)
     # editor
-    m = re.search(r"\b(?:Edited by|Editor(?:s)?:)\s*([^\n,]+)", text, flags=re.I)
+    m = _RE_EDITOR.search(text)
     if m: editor = _clean_name(m.group(1))
     if author != UNKNOWN and editor.lower() == author.lower(): editor = UNKNOWN
     return author, editor
 
 def _find_year(text: str) -> str:
-    # Prefer years near Copyright/Published; else first plausible year 1500–2035
-    year_pat = r"(?<!\d)(1[5-9]\d{2}|20[0-2]\d|203[0-5])(?!\d)"
-    for term in ("©", "Copyright", "First published", "Published", "Reprinted"):
-        m = re.search(term + r".{0,60}" + year_pat, text, flags=re.I | re.S)
-        if m:
-            y = re.search(year_pat, m.group(0))
-            if y: return y.group(0)
-    m = re.search(year_pat, text)
+    # Prefer years near ©/Copyright/First published/Published/Reprinted (in that order);
+    # else first plausible year 1500–2035
+    for pat in _RE_YEAR_CTX:
+        m = pat.search(text)
+        if m: return m.group(1)
+    m = _RE_YEAR.search(text)
     return m.group(1) if m else UNKNOWN
 
-def _find_publisher(text: str) -> str:
-    for ln in text.splitlines():
-        m = re.search(r"\b(Published by|Publisher|Imprint|Printed by)\s*[:\-]\s*(.+)", ln, flags=re.I)
+def _find_publisher(lines: List[str]) -> str:
+    # publisher info lives in front matter; bound the scan so long extracts stay cheap
+    for ln in islice(lines, 120):
+        m = _RE_PUB.search(ln)
         if m:
-            cand = re.split(r"[;|•]|Tel:|Phone:|Fax:|Email:|www\.", m.group(2).strip())[0].strip()
-            cand = re.sub(r"\s{2,}", " ", cand)
+            cand = _RE_PUB_SPLIT.split(m.group(2).strip())[0].strip()
+            cand = _RE_WS.sub(" ", cand)
             if 2 <= len(cand) <= 120: return cand
     # fallback: a plausible single line
-    for ln in text.splitlines()[:80]:
-        if re.search(r"\b(Press|Publications|Publishers|University|House|Books)\b", ln, flags=re.I):
-            s = ln.strip()
-            if 2 <= len(s) <= 120: return s
+    for ln in lines[:80]:
+        if _RE_PUB_FALLBACK.search(ln) and 2 <= len(ln) <= 120: return ln
     return UNKNOWN
 
+# (script, first codepoint, last codepoint, language) - in tie-break order
+_SCRIPTS = (
+    ("Devanagari", 0x0900, 0x097F, "Hindi"), ("Bengali", 0x0980, 0x09FF, "Bengali"),
+    ("Gurmukhi", 0x0A00, 0x0A7F, "Punjabi"), ("Gujarati", 0x0A80, 0x0AFF, "Gujarati"),
+    ("Oriya", 0x0B00, 0x0B7F, "Odia"), ("Tamil", 0x0B80, 0x0BFF, "Tamil"),
+    ("Telugu", 0x0C00, 0x0C7F, "Telugu"), ("Kannada", 0x0C80, 0x0CFF, "Kannada"),
+    ("Malayalam", 0x0D00, 0x0D7F, "Malayalam"), ("Latin", 0x0000, 0x024F, "English"),
+    ("Arabic", 0x0600, 0x06FF, "Arabic"), ("Cyrillic", 0x0400, 0x04FF, "Russian"),
+)
+# BMP codepoint -> bin (0 = no tracked script, k+1 = _SCRIPTS[k]); built once at import
+_LANG_LUT = np.zeros(0x10000, dtype=np.uint8)
+for _k, (_, _lo, _hi, _) in enumerate(_SCRIPTS, start=1):
+    _LANG_LUT[_lo:_hi + 1] = _k
+
 def _guess_language(sample: str) -> str:
     if not sample or len(sample.strip()) < 40: return UNKNOWN
-    counts = {k:0 for k in ("Devanagari","Bengali","Gurmukhi","Gujarati","Oriya","Tamil","Telugu","Kannada","Malayalam","Latin","Arabic","Cyrillic")}
-    for ch in sample[:5000]:
-        cp = ord(ch)
-        if   0x0900 <= cp <= 0x097F: counts["Devanagari"] += 1
-        elif 0x0980 <= cp <= 0x09FF: counts["Bengali"] += 1
-        elif 0x0A00 <= cp <= 0x0A7F: counts["Gurmukhi"] += 1
-        elif 0x0A80 <= cp <= 0x0AFF: counts["Gujarati"] += 1
-        elif 0x0B00 <= cp <= 0x0B7F: counts["Oriya"] += 1
-        elif 0x0B80 <= cp <= 0x0BFF: counts["Tamil"] += 1
-        elif 0x0C00 <= cp <= 0x0C7F: counts["Telugu"] += 1
-        elif 0x0C80 <= cp <= 0x0CFF: counts["Kannada"] += 1
-        elif 0x0D00 <= cp <= 0x0D7F: counts["Malayalam"] += 1
-        elif 0x0400 <= cp <= 0x04FF: counts["Cyrillic"] += 1
-        elif 0x0600 <= cp <= 0x06FF: counts["Arabic"] += 1
-        elif (0x0000 <= cp <= 0x024F): counts["Latin"] += 1
-    script, n = max(counts.items(), key=lambda kv: kv[1])
-    if n < 20: return UNKNOWN
-    return {
-        "Devanagari":"Hindi","Bengali":"Bengali","Gurmukhi":"Punjabi","Gujarati":"Gujarati","Oriya":"Odia",
-        "Tamil":"Tamil","Telugu":"Telugu","Kannada":"Kannada","Malayalam":"Malayalam",
-        "Arabic":"Arabic","Cyrillic":"Russian","Latin":"English"
-    }.get(script, UNKNOWN)
+    cps = np.frombuffer(sample[:5000].encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    counts = np.bincount(_LANG_LUT[cps[cps < 0x10000]], minlength=len(_SCRIPTS) + 1)[1:]
+    k = int(counts.argmax())
+    if counts[k] < 20: return UNKNOWN
+    return _SCRIPTS[k][3]
 
 # core
-def parse_pdf(pdf_path: Path, use_ocr: bool) -> Dict[str, str]:
+def _unknown_record() -> Record:
+    return (UNKNOWN,) * 7 + ("PDF",)
+
+def _looks_like_pdf(pdf_path: Path) -> bool:
+    # the %PDF- header must appear within the first 1024 bytes
     try:
+        with open(pdf_path, "rb") as f:
+            return b"%PDF-" in f.read(1024)
+    except OSError:
+        return False
+
+def parse_pdf(pdf_path: Path, use_ocr: bool) -> Record:
+    # returns the record as a tuple in RECORD_FIELDS order; see parse_pdf_dict
+    if not _looks_like_pdf(pdf_path):  # *.pdf by name only; don't let MuPDF parse it
+        return _unknown_record()
+    try:
+        # pull everything needed out of the document, then close it before the
+        # regex work so pool workers don't hold MuPDF page caches alive
         with fitz.open(pdf_path) as doc:
             meta = doc.metadata or {}
-            text = _front_text(doc, 8)
-            if use_ocr and (not text or len(text) < 40):
-                ocr = _ocr_first_pages(pdf_path, 3)
-                if len(ocr) > len(text): text = ocr
-
+            page_count = doc.page_count
             title = (meta.get("title") or "").strip()
-            if not title or title.lower() in {"", "untitled", "unknown"}:
-                title = _guess_title([ln for ln in text.splitlines() if ln.strip()]) or UNKNOWN
-
-            author, editor = _find_people(text, meta.get("author"))
-            year = _find_year(text)
-            publisher = _find_publisher(text)
-
-            lang_text = text if len(doc) <= 8 else _front_text(doc, min(12, len(doc)))
-            language = _guess_language(lang_text)
-
-            return {
-                "Book Title": title or UNKNOWN,
-                "Author": author or UNKNOWN,
-                "Editor": editor or UNKNOWN,
-                "Year of Publishing": year or UNKNOWN,
-                "Publisher": publisher or UNKNOWN,
-                "Language": language or UNKNOWN,
-                "Number of Pages": str(doc.page_count) if doc.page_count else UNKNOWN,
-                "Format": "PDF",
-            }
+            meta_author = (meta.get("author") or "").strip()
+            have_title = title.lower() not in {"", "untitled", "unknown"}
+            pages_text = _front_text_pages(doc, 0, 8)
+            # language samples up to 12 pages; extend the pages already read instead of re-extracting them
+            lang_extra = _front_text_pages(doc, 8, 12) if page_count > 8 else None
+
+        text = "\n".join(pages_text).strip()
+        if use_ocr and (not text or len(text) < 40):
+            ocr = _ocr_first_pages(pdf_path, 3)
+            if len(ocr) > len(text): text = ocr
+        lines = [s for s in (ln.strip() for ln in text.splitlines()) if s]  # split once, shared by helpers
+
+        if not have_title:
+            title = _guess_title(lines) or UNKNOWN
+
+        author, editor = _find_people(text, meta_author)
+        year = _find_year(text)
+        publisher = _find_publisher(lines)
+        lang_text = "\n".join(pages_text + lang_extra).strip() if lang_extra is not None else text
+        language = _guess_language(lang_text)
+
+        return (
+            title or UNKNOWN, author or UNKNOWN, editor or UNKNOWN, year or UNKNOWN,
+            publisher or UNKNOWN, language or UNKNOWN,
+            str(page_count) if page_count else UNKNOWN, "PDF",
+        )
     except Exception:
-        return {
-            "Book Title": UNKNOWN, "Author": UNKNOWN, "Editor": UNKNOWN,
-            "Year of Publishing": UNKNOWN, "Publisher": UNKNOWN,
-            "Language": UNKNOWN, "Number of Pages": UNKNOWN, "Format": "PDF",
-        }
-
-def build_catalog(input_dir: Path, output_xlsx: Path, use_ocr: bool) -> pd.DataFrame:
-    pdfs = sorted(input_dir.rglob("*.pdf"), key=lambda p: p.name.lower())
-    rows = []
-    for p in pdfs:
-        rec = parse_pdf(p, use_ocr)
-        rec["Source File"] = str(p.resolve())
-        rows.append(rec)
-    df = pd.DataFrame(rows, columns=[
-        "Book Title","Author","Editor","Year of Publishing","Publisher","Language","Number of Pages","Format","Source File"
-    ])
+        return _unknown_record()
+
+def parse_pdf_dict(pdf_path: Path, use_ocr: bool) -> Dict[str, str]:
+    return dict(zip(RECORD_FIELDS, parse_pdf(pdf_path, use_ocr)))
+
+def _parse_one(job: tuple[str, bool]) -> Record:
+    # module-level so ProcessPoolExecutor can pickle it
+    path, use_ocr = job
+    return parse_pdf(Path(path), use_ocr)
+
+def _walk_pdfs(d: str) -> Iterator[os.DirEntry]:
+    # scandir returns names + file types per directory read; no Path per file
+    try:
+        with os.scandir(d) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False): yield from _walk_pdfs(e.path)
+                elif e.name.lower().endswith(".pdf"): yield e
+    except OSError:
+        pass  # unreadable directory: skip it, as rglob does
+
+# parse cache: skip PDFs whose (path, mtime, size) is unchanged since the last run
+CACHE_NAME = ".autocatalog_cache.json"
+CACHE_VERSION = 3  # bump whenever the extraction heuristics or record layout change
+
+def _cache_key(entry: os.DirEntry, src: str, use_ocr: bool) -> str | None:
+    try:
+        st = entry.stat()
+    except OSError:  # dangling symlink / removed since the scan: parse (fail-soft), don't cache
+        return None
+    return f"{src}|{st.st_mtime_ns}|{st.st_size}|{int(use_ocr)}"
+
+def _load_cache(path: Path) -> Dict[str, Record]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CACHE_VERSION: return {}  # written by other heuristics
+        return {k: tuple(v) for k, v in data["rows"].items() if isinstance(v, list) and len(v) == len(RECORD_FIELDS)}
+    except Exception:
+        return {}
+
+def _save_cache(path: Path, cache: Dict[str, Record]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "rows": cache}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # cache is best-effort; the catalog itself is already written
+
+# pipeline: parse pool -> bounded queue -> writer thread owning the workbook
+_PIPELINE_DEPTH = 256  # max in-flight parses / queued rows
+_DONE = object()   # run finished: save the workbook
+_ABORT = object()  # run failed / interrupted: keep the previous catalog
+
+def _parse_ordered(jobs: List[tuple[str, bool]], ex: ProcessPoolExecutor | None) -> Iterator[Record]:
+    # yields parse results in job order, keeping at most _PIPELINE_DEPTH in flight.
+    # The first window is submitted eagerly so the pool has forked its workers
+    # before the caller starts the writer thread.
+    if ex is None:
+        return map(_parse_one, jobs)
+    it = iter(jobs)
+    window = deque(ex.submit(_parse_one, job) for job in islice(it, _PIPELINE_DEPTH))
+    def drain() -> Iterator[Record]:
+        for job in it:
+            yield window.popleft().result()
+            window.append(ex.submit(_parse_one, job))
+        while window: yield window.popleft().result()
+    return drain()
+
+def _write_xlsx(output_xlsx: Path, q: queue.Queue, errors: list) -> None:
+    # write-only workbook streams rows to disk instead of holding every cell in memory;
+    # it lands in a temp file that only replaces output_xlsx once the run succeeded
+    tmp = output_xlsx.with_name(output_xlsx.name + ".tmp")
+    row = None
+    try:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Catalog")
+        ws.append(COLUMNS)
+        while (row := q.get()) is not _DONE and row is not _ABORT:
+            ws.append(row)
+        if row is _DONE:
+            wb.save(tmp)
+            os.replace(tmp, output_xlsx)
+    except Exception as e:
+        errors.append(e)
+        while row is not _DONE and row is not _ABORT:  # keep draining so the producer never blocks
+            row = q.get()
+    finally:
+        if tmp.exists():
+            try: tmp.unlink()
+            except OSError: pass
+
+def build_catalog(input_dir: Path, output_xlsx: Path, use_ocr: bool, cache_path: Path | None = None) -> pd.DataFrame:
+    entries = sorted(_walk_pdfs(str(input_dir)), key=lambda e: e.name.lower())
+    srcs = [os.path.realpath(e.path) for e in entries]
+    if cache_path:
+        cache = _load_cache(cache_path)
+        keys = [_cache_key(e, src, use_ocr) for e, src in zip(entries, srcs)]
+    else:
+        cache, keys = {}, [None] * len(entries)
+    # only cache misses go to the parser / pool
+    jobs = [(src, use_ocr) for src, k in zip(srcs, keys) if k not in cache]
     output_xlsx.parent.mkdir(parents=True, exist_ok=True)
-    with pd.ExcelWriter(output_xlsx, engine="openpyxl") as w:
-        df.to_excel(w, index=False, sheet_name="Catalog")
-    return df
+    q, errors = queue.Queue(maxsize=_PIPELINE_DEPTH), []
+    writer = threading.Thread(target=_write_xlsx, args=(output_xlsx, q, errors), daemon=True)
+    # small batches: pool spawn overhead outweighs the gain
+    ex = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 8)) if len(jobs) >= 4 else None
+    rows, seen, done = [], {}, False
+    try:
+        fresh = _parse_ordered(jobs, ex)  # workers fork here, before the writer thread exists
+        writer.start()
+        for src, k in zip(srcs, keys):
+            rec = cache[k] if k in cache else next(fresh)
+            if k is not None: seen[k] = rec
+            row = rec + (src,)
+            rows.append(row)
+            q.put(row)
+        done = True
+    finally:
+        # on error / Ctrl-C drop queued parses instead of finishing the whole window
+        if ex is not None: ex.shutdown(cancel_futures=not done)
+        if writer.is_alive():
+            q.put(_DONE if done else _ABORT)
+            writer.join()
+    if errors: raise errors[0]
+    if cache_path: _save_cache(cache_path, seen)  # drops entries for removed/changed files
+    return pd.DataFrame(rows, columns=COLUMNS)
 
 # cli
 def main():
@@ -201,15 +400,18 @@ def main():
     ap.add_argument("-i","--input", required=True, help="Folder containing PDFs")
     ap.add_argument("-o","--output", default="catalog.xlsx", help="Output Excel path")
     ap.add_argument("--ocr", action="store_true", help="Enable OCR fallback (requires pytesseract + pdf2image + system deps)")
+    ap.add_argument("--no-cache", action="store_true", help=f"Re-parse every PDF instead of reusing {CACHE_NAME} next to the output")
     args = ap.parse_args()
 
     src = Path(args.input).expanduser().resolve()
     if not src.is_dir(): raise SystemExit(f"ERROR: Input directory not found: {src}")
-    if args.ocr and not OCR_AVAILABLE:
+    use_ocr = args.ocr and _ocr_available()
+    if args.ocr and not use_ocr:
         print("WARNING: --ocr requested but OCR deps not available. Proceeding without OCR.")
 
     out = Path(args.output).expanduser().resolve()
-    df = build_catalog(src, out, args.ocr and OCR_AVAILABLE)
+    cache = None if args.no_cache else out.parent / CACHE_NAME
+    df = build_catalog(src, out, use_ocr, cache)
     print(f"Catalog saved to: {out}")
     print(f"Total PDFs: {len(df)}")
 